@@ -3,6 +3,7 @@ from http import HTTPStatus
 from typing import Any
 
 from fastapi import APIRouter, Depends, HTTPException, Query, Request
+from fastapi.responses import JSONResponse
 from httpx import HTTPStatusError
 from pydantic import EmailStr
 
@@ -105,7 +106,10 @@ async def get_customers(
 
     try:
 
-        return await customer_service.get_user(filters)
+        customers = await customer_service.get_user(filters)
+        # Отдаём Response напрямую, чтобы FastAPI не валидировал листинг
+        # повторно через response_model (он остаётся для документации).
+        return JSONResponse([customer.to_dict() for customer in customers])
 
     except HTTPStatusError as exc:
         try:
@@ -1,4 +1,5 @@
 from fastapi import APIRouter, Depends, HTTPException, Query, Request
+from fastapi.responses import JSONResponse
 from httpx import HTTPStatusError
 
 from api.v1.models.order import (OrderCreate, OrderCreatePayment,
@@ -63,7 +64,8 @@ async def get_customers(
         "customerId": customer_id,
     }
     try:
-        return await order_service.get_orders_by_user_id(filters)
+        # Ответ CRM уже JSON-совместим, jsonable_encoder по нему не нужен.
+        return JSONResponse(await order_service.get_orders_by_user_id(filters))
     except HTTPStatusError as exc:
         try:
             detail = exc.response.json()
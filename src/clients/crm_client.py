@@ -1,10 +1,14 @@
-from functools import lru_cache
+import asyncio
+import time
 
 import backoff
-from httpx import AsyncClient, HTTPStatusError, TransportError
+from httpx import AsyncClient, HTTPStatusError, Limits, TransportError
 
 from clients.base import AbstractHTTPClient
+from core.admission import (Overloaded, PrioritySemaphore, UpstreamLatency,
+                            build_lanes, classify)
 from core.config import settings
+from core.tenants import TenantConfig
 from logger import logger
 
 RETRYABLE_STATUSES: set[int] = {429, 500, 502, 503, 504}
@@ -17,7 +21,62 @@ def _give_up(exc: Exception) -> bool:
     return False
 
 
+class RateLimiter:
+    """Token bucket: не больше `rate` запросов в секунду с всплеском до `rate`."""
+
+    def __init__(self, rate: float):
+        self.rate = rate
+        self.capacity = max(rate, 1.0)
+        self._tokens = self.capacity
+        self._updated = time.monotonic()
+        self._lock = asyncio.Lock()
+
+    async def acquire(self) -> None:
+        async with self._lock:
+            while True:
+                now = time.monotonic()
+                self._tokens = min(
+                    self.capacity, self._tokens + (now - self._updated) * self.rate
+                )
+                self._updated = now
+                if self._tokens >= 1:
+                    self._tokens -= 1
+                    return
+                await asyncio.sleep((1 - self._tokens) / self.rate)
+
+
 class CrmClient(AbstractHTTPClient):
+    def __init__(self, tenant: TenantConfig):
+        self.tenant = tenant
+        self.lanes = build_lanes()
+        self.latency = UpstreamLatency(
+            alpha=settings.admission_latency_alpha,
+            stale_after=settings.admission_latency_stale_after,
+        )
+        self._rate_limiter = RateLimiter(tenant.rate_limit)
+        self._slots = PrioritySemaphore(tenant.max_concurrency)
+        self._client: AsyncClient | None = None
+
+    @property
+    def client(self) -> AsyncClient:
+        # Пул соединений создаётся лениво и живёт всё время работы процесса,
+        # у каждого аккаунта CRM он свой.
+        if self._client is None:
+            self._client = AsyncClient(
+                base_url=str(self.tenant.base_url),
+                headers={"X-API-KEY": self.tenant.api_key},
+                limits=Limits(
+                    max_connections=self.tenant.max_concurrency,
+                    max_keepalive_connections=self.tenant.max_concurrency,
+                ),
+            )
+        return self._client
+
+    async def aclose(self) -> None:
+        if self._client is not None:
+            await self._client.aclose()
+            self._client = None
+
     @backoff.on_exception(
         backoff.expo,
         (TransportError, HTTPStatusError),
@@ -35,12 +94,16 @@ class CrmClient(AbstractHTTPClient):
         json: dict[str, object] | None = None,
         headers: dict[str, str] | None = None,
     ) -> dict[str, object]:
-        async with AsyncClient() as client:
+        if not await self._slots.acquire(classify(method), settings.crm_queue_timeout):
+            raise Overloaded(f"CRM {self.tenant.name}: нет свободных соединений")
+        try:
+            await self._rate_limiter.acquire()
+            started = time.monotonic()
             try:
-                response = await client.request(
+                response = await self.client.request(
                     method=method,
-                    url=f"{settings.base_url}{path}",
-                    headers={"X-API-KEY": settings.api_key, **(headers or {})},
+                    url=path,
+                    headers=headers,
                     params=params or {},
                     data=data,
                     json=json,
@@ -49,11 +112,20 @@ class CrmClient(AbstractHTTPClient):
                 return response.json()
 
             except HTTPStatusError as exc:
-                logger.error("RetailCRM %s: %s", exc.response.status_code, exc)
+                logger.error(
+                    "RetailCRM[%s] %s: %s",
+                    self.tenant.name,
+                    exc.response.status_code,
+                    exc,
+                )
                 raise
             except TransportError as exc:
-                logger.error("CRM transport error: %s", exc)
+                logger.error("CRM[%s] transport error: %s", self.tenant.name, exc)
                 raise
+            finally:
+                self.latency.observe(time.monotonic() - started)
+        finally:
+            self._slots.release()
 
     async def get(
         self,
@@ -85,11 +157,3 @@ class CrmClient(AbstractHTTPClient):
             json=json,
             headers=headers,
         )
-
-
-crm_client = CrmClient()
-
-
-@lru_cache
-def get_crm_client() -> CrmClient:
-    return crm_client
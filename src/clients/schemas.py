@@ -1,4 +1,5 @@
 from datetime import datetime
+from typing import Any, Mapping
 
 from pydantic import BaseModel
 
@@ -10,3 +11,59 @@ class ExternalCustomer(BaseModel):
     firstName: str | None = None
     email: str | None = None
     phones: list[dict[str, str]]
+
+
+def _optional_str(name: str, value: Any) -> str | None:
+    if value is not None and not isinstance(value, str):
+        raise ValueError(f"{name}: ожидалась строка, получено {value!r}")
+    return value
+
+
+class CustomerRecord:
+    """Лёгкая запись клиента из листинга RetailCRM.
+
+    Та же форма, что у ExternalCustomer, но без копирования вложенных
+    структур: `phones` ссылается на уже разобранный JSON. Проверка типов
+    ленивая — при обращении к `createdAt` и в `to_dict`, то есть до того,
+    как запись уйдёт клиенту; некорректные данные CRM дают ValueError.
+    """
+
+    __slots__ = ("id", "lastName", "firstName", "email", "phones", "_createdAt")
+
+    def __init__(self, raw: Mapping[str, Any]):
+        self.id: int = raw["id"]
+        self._createdAt: str | datetime = raw["createdAt"]
+        self.lastName: str | None = raw.get("lastName")
+        self.firstName: str | None = raw.get("firstName")
+        self.email: str | None = raw.get("email")
+        self.phones: list[dict[str, str]] = raw["phones"]
+
+    @property
+    def createdAt(self) -> datetime:
+        if not isinstance(self._createdAt, datetime):
+            if not isinstance(self._createdAt, str):
+                raise ValueError(f"createdAt: ожидалась дата, получено {self._createdAt!r}")
+            self._createdAt = datetime.fromisoformat(self._createdAt)
+        return self._createdAt
+
+    def to_dict(self) -> dict[str, Any]:
+        if type(self.id) is not int:
+            raise ValueError(f"id: ожидалось целое, получено {self.id!r}")
+        if type(self.phones) is not list:
+            raise ValueError(f"phones: ожидался список, получено {self.phones!r}")
+        for phone in self.phones:
+            # Ключи объектов JSON всегда строки, проверяем только значения.
+            if type(phone) is not dict:
+                raise ValueError(f"phones: ожидался словарь, получено {phone!r}")
+            for value in phone.values():
+                if type(value) is not str:
+                    raise ValueError(f"phones: ожидалась строка, получено {value!r}")
+
+        return {
+            "id": self.id,
+            "createdAt": self.createdAt.isoformat(),
+            "lastName": _optional_str("lastName", self.lastName),
+            "firstName": _optional_str("firstName", self.firstName),
+            "email": _optional_str("email", self.email),
+            "phones": self.phones,
+        }
@@ -0,0 +1,82 @@
+from http import HTTPStatus
+
+from fastapi import HTTPException, Request
+
+from clients.crm_client import CrmClient
+from core.config import settings
+from core.tenants import TenantConfig, load_tenants
+
+UNKNOWN_TENANT_DETAIL = "Не удалось определить аккаунт CRM"
+
+
+class TenantRegistry:
+
+    def __init__(self, tenants: list[TenantConfig], strict_sites: bool = False):
+        self.strict_sites = strict_sites
+        self.clients: dict[str, CrmClient] = {}
+        self.sites: dict[str, CrmClient] = {}
+        for tenant in tenants:
+            client = CrmClient(tenant)
+            self.clients[tenant.name] = client
+            for site in tenant.sites:
+                self.sites[site] = client
+
+    def find(
+        self, tenant: str | None = None, site: str | None = None
+    ) -> CrmClient | None:
+        if tenant:
+            return self.clients.get(tenant)
+        if site:
+            if site in self.sites:
+                return self.sites[site]
+            # При заданном файле аккаунтов неизвестный site — это чужой
+            # магазин, отправлять его в аккаунт по умолчанию нельзя.
+            if self.strict_sites:
+                return None
+        return self.clients.get(settings.default_tenant)
+
+    async def aclose(self) -> None:
+        for client in self.clients.values():
+            await client.aclose()
+
+
+tenant_registry = TenantRegistry(
+    load_tenants(), strict_sites=settings.tenants_file is not None
+)
+
+
+async def _body_site(request: Request) -> str | None:
+    if request.method != "POST":
+        return None
+    try:
+        body = await request.json()
+    except ValueError:
+        return None
+    return body.get("site") if isinstance(body, dict) else None
+
+
+async def resolve_crm_client(request: Request) -> CrmClient | None:
+    """Определяет аккаунт CRM запроса и запоминает его в request.state.
+
+    Порядок: заголовок аккаунта, `site` в query, `site` в теле POST.
+    """
+    if hasattr(request.state, "crm_client"):
+        return request.state.crm_client
+
+    tenant = request.headers.get(settings.tenant_header)
+    site = request.query_params.get("site")
+    if not tenant and not site:
+        site = await _body_site(request)
+
+    request.state.crm_client = tenant_registry.find(tenant, site)
+    return request.state.crm_client
+
+
+async def get_crm_client(request: Request) -> CrmClient:
+    client = await resolve_crm_client(request)
+    if client is None:
+        raise HTTPException(
+            status_code=HTTPStatus.BAD_REQUEST,
+            detail=UNKNOWN_TENANT_DETAIL,
+        )
+    return client
@@ -0,0 +1,153 @@
+import asyncio
+import time
+from collections import deque
+from enum import Enum
+
+from core.config import settings
+
+WRITE_METHODS: set[str] = {"POST", "PUT", "PATCH", "DELETE"}
+
+
+class TrafficClass(Enum):
+    write = "write"
+    read = "read"
+
+
+class Overloaded(Exception):
+    """Запрос не получил слот вовремя и должен завершиться 503."""
+
+
+class UpstreamLatency:
+    """Скользящее среднее (EWMA) задержки ответов RetailCRM."""
+
+    def __init__(self, alpha: float, stale_after: float):
+        self.alpha = alpha
+        self.stale_after = stale_after
+        self._value = 0.0
+        self._observed_at = 0.0
+
+    def observe(self, seconds: float) -> None:
+        if self._observed_at:
+            self._value += self.alpha * (seconds - self._value)
+        else:
+            self._value = seconds
+        self._observed_at = time.monotonic()
+
+    @property
+    def value(self) -> float:
+        # Если свежих замеров нет (например, все чтения отбрасываются),
+        # считаем что CRM восстановилась, иначе полоса не откроется никогда.
+        if time.monotonic() - self._observed_at > self.stale_after:
+            return 0.0
+        return self._value
+
+
+class AdmissionLane:
+    """Лимит одновременных запросов класса с короткой ограниченной очередью."""
+
+    def __init__(
+        self,
+        traffic_class: TrafficClass,
+        limit: int,
+        queue_size: int,
+        queue_timeout: float,
+        latency_threshold: float,
+    ):
+        self.traffic_class = traffic_class
+        self.limit = limit
+        self.queue_size = queue_size
+        self.queue_timeout = queue_timeout
+        self.latency_threshold = latency_threshold
+        self._semaphore = asyncio.Semaphore(limit)
+        self._waiting = 0
+
+    @property
+    def waiting(self) -> int:
+        return self._waiting
+
+    async def acquire(self) -> bool:
+        if self._semaphore.locked() and self._waiting >= self.queue_size:
+            return False
+
+        self._waiting += 1
+        try:
+            # asyncio.timeout, а не wait_for: в 3.11 wait_for может потерять
+            # слот, если acquire завершился одновременно с таймаутом.
+            async with asyncio.timeout(self.queue_timeout):
+                await self._semaphore.acquire()
+        except TimeoutError:
+            return False
+        finally:
+            self._waiting -= 1
+        return True
+
+    def release(self) -> None:
+        self._semaphore.release()
+
+
+class PrioritySemaphore:
+    """Семафор, который освободившийся слот отдаёт сначала записи, потом чтению."""
+
+    def __init__(self, limit: int):
+        self._free = limit
+        self._waiters: dict[TrafficClass, deque[asyncio.Future]] = {
+            TrafficClass.write: deque(),
+            TrafficClass.read: deque(),
+        }
+
+    async def acquire(self, traffic_class: TrafficClass, timeout: float) -> bool:
+        if self._free > 0 and not any(self._waiters.values()):
+            self._free -= 1
+            return True
+
+        waiter = asyncio.get_running_loop().create_future()
+        queue = self._waiters[traffic_class]
+        queue.append(waiter)
+        try:
+            async with asyncio.timeout(timeout):
+                await waiter
+        except BaseException as exc:
+            if waiter.done() and not waiter.cancelled():
+                # Слот уже передан нам в release(), отдаём его следующему.
+                self.release()
+            elif waiter in queue:
+                queue.remove(waiter)
+            if isinstance(exc, TimeoutError):
+                return False
+            raise
+        return True
+
+    def release(self) -> None:
+        for traffic_class in (TrafficClass.write, TrafficClass.read):
+            queue = self._waiters[traffic_class]
+            while queue:
+                waiter = queue.popleft()
+                if not waiter.done():
+                    waiter.set_result(None)
+                    return
+        self._free += 1
+
+
+def build_lanes() -> dict[TrafficClass, AdmissionLane]:
+    return {
+        TrafficClass.write: AdmissionLane(
+            TrafficClass.write,
+            limit=settings.admission_write_limit,
+            queue_size=settings.admission_write_queue,
+            queue_timeout=settings.admission_write_queue_timeout,
+            latency_threshold=settings.admission_write_latency_threshold,
+        ),
+        TrafficClass.read: AdmissionLane(
+            TrafficClass.read,
+            limit=settings.admission_read_limit,
+            queue_size=settings.admission_read_queue,
+            queue_timeout=settings.admission_read_queue_timeout,
+            latency_threshold=settings.admission_read_latency_threshold,
+        ),
+    }
+
+
+def classify(method: str) -> TrafficClass:
+    if method.upper() in WRITE_METHODS:
+        return TrafficClass.write
+    return TrafficClass.read
@@ -0,0 +1,96 @@
+import json
+import queue
+import threading
+from pathlib import Path
+
+from core.config import settings
+from logger import logger
+
+CAPTURED_HEADERS: tuple[str, ...] = ("content-type", settings.tenant_header.lower())
+
+
+class TrafficCapture:
+    """Пишет входящие запросы в NDJSON для последующего replay.
+
+    Запись идёт в отдельном потоке: обработчик запроса только кладёт
+    кортеж в очередь, сериализация и файловый ввод-вывод вне event loop.
+    Очередь ограничена: если поток записи не успевает, записи отбрасываются
+    и считаются в `dropped`, а не копятся в памяти.
+    """
+
+    def __init__(self, path: Path, max_queue: int):
+        self.path = path
+        self.dropped = 0
+        self._queue: queue.Queue = queue.Queue(maxsize=max_queue)
+        self._thread: threading.Thread | None = None
+
+    def start(self) -> None:
+        if self._thread is not None:
+            return
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self._thread = threading.Thread(
+            target=self._run, name="traffic-capture", daemon=True
+        )
+        self._thread.start()
+
+    def record(
+        self,
+        ts: float,
+        method: str,
+        path: str,
+        query: str,
+        headers: dict[str, str],
+        body: bytes,
+        status: int,
+        duration: float,
+    ) -> None:
+        try:
+            self._queue.put_nowait(
+                (ts, method, path, query, headers, body, status, duration)
+            )
+        except queue.Full:
+            self.dropped += 1
+            if self.dropped % 1000 == 1:
+                logger.warning(
+                    "Traffic capture queue is full, dropped %s records", self.dropped
+                )
+
+    def stop(self) -> None:
+        if self._thread is None:
+            return
+        self._queue.put(None)
+        self._thread.join()
+        self._thread = None
+
+    def _run(self) -> None:
+        with self.path.open("a", encoding="utf-8") as fh:
+            while True:
+                item = self._queue.get()
+                if item is None:
+                    break
+                ts, method, path, query, headers, body, status, duration = item
+                fh.write(
+                    json.dumps(
+                        {
+                            "ts": ts,
+                            "method": method,
+                            "path": path,
+                            "query": query,
+                            "headers": headers,
+                            "body": body.decode("utf-8", errors="replace"),
+                            "status": status,
+                            "duration": round(duration, 6),
+                        },
+                        ensure_ascii=False,
+                    )
+                )
+                fh.write("\n")
+                if self._queue.empty():
+                    fh.flush()
+
+
+traffic_capture = (
+    TrafficCapture(settings.capture_file, settings.capture_queue_size)
+    if settings.capture_file
+    else None
+)
@@ -10,9 +10,33 @@ _env_path = (Path(__file__).parent.parent / ".env").resolve()
 class Settings(BaseSettings):
     project_name: str
     port: int
-    api_key: str
+    api_key: str | None = None
     mode: Literal["dev", "prod"] = "dev"
-    base_url: HttpUrl
+    base_url: HttpUrl | None = None
+
+    tenants_file: Path | None = None
+    tenant_header: str = "X-Tenant"
+    default_tenant: str = "default"
+    crm_rate_limit: float = 10.0
+    crm_max_concurrency: int = 10
+    crm_queue_timeout: float = 5.0
+
+    capture_file: Path | None = None
+    capture_queue_size: int = 10000
+
+    admission_write_limit: int = 32
+    admission_write_queue: int = 64
+    admission_write_queue_timeout: float = 5.0
+    # Задержка меряется по одной попытке запроса к CRM, а она ограничена
+    # таймаутом httpx по умолчанию (5 с): порог должен быть ниже него.
+    admission_write_latency_threshold: float = 4.0
+    admission_read_limit: int = 16
+    admission_read_queue: int = 16
+    admission_read_queue_timeout: float = 0.5
+    admission_read_latency_threshold: float = 3.0
+    admission_latency_alpha: float = 0.2
+    admission_latency_stale_after: float = 10.0
+    admission_retry_after: int = 2
 
     model_config = SettingsConfigDict(
         env_file=[str(_env_path)],
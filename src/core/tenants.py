@@ -0,0 +1,63 @@
+import json
+from pathlib import Path
+
+from pydantic import BaseModel, Field, HttpUrl, TypeAdapter
+
+from core.config import settings
+
+
+class TenantConfig(BaseModel):
+    name: str = Field(..., description="Идентификатор аккаунта RetailCRM")
+    base_url: HttpUrl
+    api_key: str
+    sites: list[str] = Field(
+        default_factory=list,
+        description="Символьные коды магазинов (site) этого аккаунта",
+    )
+    rate_limit: float = Field(
+        default=settings.crm_rate_limit,
+        gt=0,
+        description="Запросов в секунду к CRM",
+    )
+    max_concurrency: int = Field(
+        default=settings.crm_max_concurrency,
+        gt=0,
+        description="Одновременных запросов к CRM",
+    )
+
+
+def load_tenants(path: Path | None = None) -> list[TenantConfig]:
+    tenants: list[TenantConfig] = []
+
+    if settings.base_url and settings.api_key:
+        tenants.append(
+            TenantConfig(
+                name=settings.default_tenant,
+                base_url=settings.base_url,
+                api_key=settings.api_key,
+            )
+        )
+
+    path = path or settings.tenants_file
+    if path:
+        raw = json.loads(Path(path).read_text(encoding="utf-8"))
+        tenants.extend(TypeAdapter(list[TenantConfig]).validate_python(raw))
+
+    _check_unique(tenants)
+    return tenants
+
+
+def _check_unique(tenants: list[TenantConfig]) -> None:
+    # Дубликат имени или site молча перенаправил бы заказы в чужой аккаунт CRM.
+    names: set[str] = set()
+    sites: dict[str, str] = {}
+    for tenant in tenants:
+        if tenant.name in names:
+            raise ValueError(f"Аккаунт CRM {tenant.name!r} описан несколько раз")
+        names.add(tenant.name)
+        for site in tenant.sites:
+            if site in sites:
+                raise ValueError(
+                    f"site {site!r} указан и в {sites[site]!r}, и в {tenant.name!r}"
+                )
+            sites[site] = tenant.name
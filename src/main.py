@@ -1,19 +1,43 @@
+from contextlib import asynccontextmanager
+
 from fastapi import FastAPI
 
 from api.v1.customers import router as customer_router
 from api.v1.orders import router as order_router
+from clients.tenants import tenant_registry
+from core.admission import Overloaded
+from core.capture import traffic_capture
 from core.config import settings
 from core.logging import setup_logging
+from middleware.admission import admission_control, overloaded_handler
 from middleware.request_logger import log_requests
 
 setup_logging()
 
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    if traffic_capture is not None:
+        traffic_capture.start()
+    yield
+    try:
+        await tenant_registry.aclose()
+    finally:
+        if traffic_capture is not None:
+            traffic_capture.stop()
+
+
 app = FastAPI(
     title=settings.project_name,
     docs_url="/docs",
     openapi_url="/api/openapi.json",
     root_path="/api",
+    lifespan=lifespan,
 )
+app.add_exception_handler(Overloaded, overloaded_handler)
+# Последний добавленный middleware — внешний: log_requests видит и
+# запросы, отброшенные admission_control.
+app.middleware("http")(admission_control)
 app.middleware("http")(log_requests)
 app.include_router(customer_router, prefix="/api/v1/customers", tags=["customers"])
 app.include_router(order_router, prefix="/api/v1/orders", tags=["orders"])
@@ -0,0 +1,78 @@
+from http import HTTPStatus
+
+from fastapi import Request
+from fastapi.responses import JSONResponse
+
+from clients.tenants import UNKNOWN_TENANT_DETAIL, resolve_crm_client
+from core.admission import Overloaded, classify
+from core.config import settings
+from logger import logger
+
+GUARDED_PREFIX = "/api/v1/"
+
+
+def _reject(reason: str) -> JSONResponse:
+    return JSONResponse(
+        status_code=HTTPStatus.SERVICE_UNAVAILABLE,
+        content={"detail": reason},
+        headers={"Retry-After": str(settings.admission_retry_after)},
+    )
+
+
+async def overloaded_handler(request: Request, exc: Overloaded) -> JSONResponse:
+    logger.warning("Admission: shed %s %s, %s", request.method, request.url.path, exc)
+    return _reject("CRM перегружена, повторите запрос позже")
+
+
+def _route_path(request: Request) -> str:
+    # Путь без root_path — тот же, по которому Starlette сопоставляет роуты.
+    path = request.scope["path"]
+    root_path = request.scope.get("root_path", "")
+    if root_path and path.startswith(root_path + "/"):
+        return path[len(root_path):]
+    return path
+
+
+async def admission_control(request: Request, call_next):
+    if not _route_path(request).startswith(GUARDED_PREFIX):
+        return await call_next(request)
+
+    # Аккаунт определяется один раз здесь и через request.state доходит до
+    # get_crm_client. Лимиты и задержка у каждого аккаунта свои: медленный
+    # аккаунт не должен приводить к отказам для остальных.
+    crm_client = await resolve_crm_client(request)
+    if crm_client is None:
+        return JSONResponse(
+            status_code=HTTPStatus.BAD_REQUEST,
+            content={"detail": UNKNOWN_TENANT_DETAIL},
+        )
+
+    lane = crm_client.lanes[classify(request.method)]
+
+    latency = crm_client.latency.value
+    if latency > lane.latency_threshold:
+        logger.warning(
+            "Admission %s: shed %s %s for %s, upstream latency %.2fs",
+            lane.traffic_class.value,
+            request.method,
+            request.url.path,
+            crm_client.tenant.name,
+            latency,
+        )
+        return _reject("CRM перегружена, повторите запрос позже")
+
+    if not await lane.acquire():
+        logger.warning(
+            "Admission %s: shed %s %s for %s, queue full or wait timed out (waiting=%s)",
+            lane.traffic_class.value,
+            request.method,
+            request.url.path,
+            crm_client.tenant.name,
+            lane.waiting,
+        )
+        return _reject("Сервис перегружен, повторите запрос позже")
+
+    try:
+        return await call_next(request)
+    finally:
+        lane.release()
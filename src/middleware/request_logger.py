@@ -1,9 +1,16 @@
+import time
+from http import HTTPStatus
+
 from fastapi import Request
 
+from core.capture import CAPTURED_HEADERS, traffic_capture
 from logger import logger
 
 
 async def log_requests(request: Request, call_next):
+    # Время прихода запроса, а не завершения: replay держит по нему темп.
+    arrived_at = time.time()
+    started = time.perf_counter()
     body = await request.body()
     body_text = body.decode("utf-8", errors="replace") or "<empty>"
 
@@ -20,5 +27,27 @@ async def log_requests(request: Request, call_next):
 
     request_with_body = Request(request.scope, receive)
 
-    response = await call_next(request_with_body)
-    return response
+    # Запись в finally, чтобы в захват попадали и запросы, завершившиеся
+    # исключением. Middleware зарегистрирован внешним, поэтому видит и 503
+    # от admission_control.
+    status = HTTPStatus.INTERNAL_SERVER_ERROR
+    try:
+        response = await call_next(request_with_body)
+        status = response.status_code
+        return response
+    finally:
+        if traffic_capture is not None:
+            traffic_capture.record(
+                ts=arrived_at,
+                method=request.method,
+                path=request.url.path,
+                query=request.url.query,
+                headers={
+                    name: request.headers[name]
+                    for name in CAPTURED_HEADERS
+                    if name in request.headers
+                },
+                body=body,
+                status=status,
+                duration=time.perf_counter() - started,
+            )
@@ -4,8 +4,9 @@ from functools import lru_cache
 from fastapi import Depends
 
 from api.v1.models.create_customer import CustomerCreate
-from clients.crm_client import CrmClient, get_crm_client
-from clients.schemas import ExternalCustomer
+from clients.crm_client import CrmClient
+from clients.schemas import CustomerRecord
+from clients.tenants import get_crm_client
 
 
 class CustomerService:
@@ -44,13 +45,7 @@ class CustomerService:
 
         response = await self.crm_client.get(path="api/v5/customers", params={**params})
 
-        try:
-            return [
-                ExternalCustomer.model_validate(customer)
-                for customer in response["customers"]
-            ]
-        except Exception as e:
-            raise e
+        return [CustomerRecord(customer) for customer in response["customers"]]
 
 
 @lru_cache()
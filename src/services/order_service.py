@@ -5,7 +5,8 @@ from fastapi import Depends
 from fastapi.encoders import jsonable_encoder
 
 from api.v1.models.order import OrderCreate, OrderCreatePayment
-from clients.crm_client import CrmClient, get_crm_client
+from clients.crm_client import CrmClient
+from clients.tenants import get_crm_client
 
 
 class OrderService:
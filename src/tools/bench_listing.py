@@ -0,0 +1,119 @@
+"""Сравнение ExternalCustomer (pydantic) и CustomerRecord на листинге клиентов.
+
+Запуск из каталога src::
+
+    python -m tools.bench_listing --page-size 100 --pages 200
+
+Печатает пропускную способность (записей в секунду) для разбора и для
+разбора с сериализацией в ответ, а также память, удерживаемую страницами.
+"""
+
+import argparse
+import gc
+import json
+import time
+import tracemalloc
+from typing import Callable
+
+from clients.schemas import CustomerRecord, ExternalCustomer
+
+
+def make_page(size: int) -> str:
+    return json.dumps(
+        {
+            "success": True,
+            "customers": [
+                {
+                    "id": i,
+                    "createdAt": "2025-01-01 12:00:00",
+                    "firstName": "Иван",
+                    "lastName": "Иванов",
+                    "email": f"customer{i}@example.com",
+                    "phones": [
+                        {"number": f"+7999000{i:04d}"},
+                        {"number": f"+7999111{i:04d}"},
+                    ],
+                    "address": {"text": "Москва, Тверская 1"},
+                    "customFields": {"loyalty": "gold"},
+                }
+                for i in range(1, size + 1)
+            ],
+        },
+        ensure_ascii=False,
+    )
+
+
+PARSERS: dict[str, Callable[[list[dict]], list]] = {
+    "pydantic": lambda rows: [ExternalCustomer.model_validate(row) for row in rows],
+    "compact": lambda rows: [CustomerRecord(row) for row in rows],
+}
+
+SERIALIZERS: dict[str, Callable[[list], list[dict]]] = {
+    "pydantic": lambda items: [item.model_dump(mode="json") for item in items],
+    "compact": lambda items: [item.to_dict() for item in items],
+}
+
+
+def throughput(name: str, pages: list[str], serialize: bool, repeat: int = 5) -> float:
+    """Лучший из `repeat` прогонов, записей в секунду."""
+    parse = PARSERS[name]
+    dump = SERIALIZERS[name]
+    best = 0.0
+    for _ in range(repeat):
+        records = 0
+        started = time.perf_counter()
+        for page in pages:
+            items = parse(json.loads(page)["customers"])
+            if serialize:
+                dump(items)
+            records += len(items)
+        best = max(best, records / (time.perf_counter() - started))
+    return best
+
+
+def memory(name: str, pages: list[str]) -> tuple[int, int]:
+    """Удерживаемая и пиковая память при разборе страниц, включая json.loads.
+
+    Сырые страницы отпускаются сразу после разбора, поэтому всё, на что
+    ссылаются записи (в том числе `phones` у CustomerRecord), учитывается.
+    """
+    gc.collect()
+    tracemalloc.start()
+    baseline = tracemalloc.get_traced_memory()[0]
+    kept = []
+    for page in pages:
+        rows = json.loads(page)["customers"]
+        kept.append(PARSERS[name](rows))
+        del rows
+    gc.collect()
+    current, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    del kept
+    return current - baseline, peak - baseline
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--page-size", type=int, default=100)
+    parser.add_argument("--pages", type=int, default=200)
+    args = parser.parse_args()
+
+    pages = [make_page(args.page_size)] * args.pages
+    total = args.page_size * args.pages
+
+    print(f"{total} records, {args.pages} pages x {args.page_size}")
+    print(
+        f"{'model':<10} {'parse rec/s':>14} {'parse+dump rec/s':>18} "
+        f"{'retained KiB':>14} {'B/record':>10} {'peak KiB':>10}"
+    )
+    for name in PARSERS:
+        retained, peak = memory(name, pages)
+        print(
+            f"{name:<10} {throughput(name, pages, serialize=False):>14,.0f} "
+            f"{throughput(name, pages, serialize=True):>18,.0f} "
+            f"{retained / 1024:>14,.0f} {retained / total:>10,.0f} {peak / 1024:>10,.0f}"
+        )
+
+
+if __name__ == "__main__":
+    main()
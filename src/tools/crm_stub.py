@@ -0,0 +1,63 @@
+"""Заглушка RetailCRM для нагрузочных прогонов.
+
+Запуск из каталога src::
+
+    STUB_LATENCY=0.05 uvicorn tools.crm_stub:app --port 9000
+
+Гейтвей направляется на неё через BASE_URL=http://127.0.0.1:9000/.
+"""
+
+import asyncio
+import os
+from itertools import count
+
+from fastapi import FastAPI, Query
+
+LATENCY = float(os.getenv("STUB_LATENCY", "0"))
+
+app = FastAPI(title="RetailCRM stub")
+_ids = count(1)
+
+
+def _customer(customer_id: int) -> dict:
+    return {
+        "id": customer_id,
+        "createdAt": "2025-01-01 12:00:00",
+        "firstName": "Иван",
+        "lastName": "Иванов",
+        "email": f"customer{customer_id}@example.com",
+        "phones": [{"number": f"+7999000{customer_id:04d}"}],
+    }
+
+
+async def _delay() -> None:
+    if LATENCY:
+        await asyncio.sleep(LATENCY)
+
+
+@app.get("/api/v5/customers")
+async def customers(limit: int = Query(20), page: int = Query(1)):
+    await _delay()
+    start = (page - 1) * limit + 1
+    return {
+        "success": True,
+        "customers": [_customer(i) for i in range(start, start + limit)],
+    }
+
+
+@app.get("/api/v5/orders")
+async def orders(limit: int = Query(20), page: int = Query(1)):
+    await _delay()
+    start = (page - 1) * limit + 1
+    return {
+        "success": True,
+        "orders": [{"id": i, "number": f"{i}A"} for i in range(start, start + limit)],
+    }
+
+
+@app.post("/api/v5/customers/create")
+@app.post("/api/v5/orders/create")
+@app.post("/api/v5/orders/payments/create")
+async def create():
+    await _delay()
+    return {"success": True, "id": next(_ids)}
@@ -0,0 +1,161 @@
+"""Повтор захваченного трафика (CAPTURE_FILE) против экземпляра гейтвея.
+
+Запуск из каталога src::
+
+    python -m tools.replay logs/capture.ndjson --target http://127.0.0.1:8000 --speed 4
+
+`--speed` масштабирует исходный темп: 1 — как в проде, 4 — в четыре раза
+быстрее, 0 — без пауз. В конце печатаются распределение задержек и доля
+ошибок, общие и по эндпоинтам.
+"""
+
+import argparse
+import asyncio
+import json
+import math
+import time
+from collections import defaultdict
+from dataclasses import dataclass
+from pathlib import Path
+
+from httpx import AsyncClient, HTTPError, Limits
+
+
+@dataclass(slots=True)
+class Result:
+    endpoint: str
+    status: int | None
+    expected: int
+    latency: float
+
+
+def rewrite_tenant(
+    records: list[dict], header: str, tenant: str | None, strip: bool
+) -> None:
+    """Подменяет или убирает заголовок аккаунта в захваченных запросах.
+
+    Захват хранит имена production-аккаунтов, которых нет у гейтвея,
+    направленного на заглушку CRM: без подмены такие запросы получат 400.
+    """
+    header = header.lower()
+    for record in records:
+        headers = {k: v for k, v in record["headers"].items() if k.lower() != header}
+        if tenant and not strip:
+            headers[header] = tenant
+        record["headers"] = headers
+
+
+def load(path: Path, limit: int | None = None) -> list[dict]:
+    records = []
+    with path.open(encoding="utf-8") as fh:
+        for line in fh:
+            if line.strip():
+                records.append(json.loads(line))
+            if limit and len(records) >= limit:
+                break
+    records.sort(key=lambda r: r["ts"])
+    return records
+
+
+async def _send(client: AsyncClient, record: dict) -> Result:
+    url = record["path"] + (f"?{record['query']}" if record["query"] else "")
+    started = time.perf_counter()
+    try:
+        response = await client.request(
+            record["method"],
+            url,
+            headers=record["headers"],
+            content=record["body"].encode("utf-8"),
+        )
+        status = response.status_code
+    except HTTPError:
+        status = None
+    return Result(
+        endpoint=f"{record['method']} {record['path']}",
+        status=status,
+        expected=record["status"],
+        latency=time.perf_counter() - started,
+    )
+
+
+async def replay(
+    records: list[dict], target: str, speed: float, timeout: float
+) -> tuple[list[Result], float]:
+    async with AsyncClient(
+        base_url=target, timeout=timeout, limits=Limits(max_connections=None)
+    ) as client:
+        tasks = []
+        first = records[0]["ts"]
+        started = time.monotonic()
+        for record in records:
+            if speed:
+                delay = (record["ts"] - first) / speed - (time.monotonic() - started)
+                if delay > 0:
+                    await asyncio.sleep(delay)
+            tasks.append(asyncio.create_task(_send(client, record)))
+        results = await asyncio.gather(*tasks)
+        return results, time.monotonic() - started
+
+
+def percentile(values: list[float], pct: float) -> float:
+    # Nearest-rank по отсортированному списку.
+    index = max(0, math.ceil(pct / 100 * len(values)) - 1)
+    return values[index]
+
+
+def _row(name: str, results: list[Result]) -> str:
+    latencies = sorted(r.latency * 1000 for r in results)
+    errors = sum(1 for r in results if r.status is None or r.status >= 500)
+    return (
+        f"{name:<45} {len(results):>7} {errors / len(results):>7.2%} "
+        + " ".join(f"{percentile(latencies, p):>8.1f}" for p in (50, 90, 99))
+        + f" {latencies[-1]:>8.1f}"
+    )
+
+
+def report(results: list[Result], elapsed: float) -> str:
+    by_endpoint: dict[str, list[Result]] = defaultdict(list)
+    for result in results:
+        by_endpoint[result.endpoint].append(result)
+
+    shed = sum(1 for r in results if r.status == 503)
+    mismatched = sum(1 for r in results if r.status != r.expected)
+    lines = [
+        f"{'endpoint':<45} {'count':>7} {'errors':>7} "
+        f"{'p50 ms':>8} {'p90 ms':>8} {'p99 ms':>8} {'max ms':>8}",
+        *(_row(name, items) for name, items in sorted(by_endpoint.items())),
+        _row("TOTAL", results),
+        "",
+        f"elapsed {elapsed:.1f}s, throughput {len(results) / elapsed:.1f} req/s, "
+        f"503 {shed}, status differs from capture {mismatched}",
+    ]
+    return "\n".join(lines)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("capture", type=Path, help="NDJSON-файл захвата")
+    parser.add_argument("--target", default="http://127.0.0.1:8000")
+    parser.add_argument("--speed", type=float, default=1.0, help="множитель темпа, 0 — без пауз")
+    parser.add_argument("--limit", type=int, default=None, help="сколько записей повторить")
+    parser.add_argument("--timeout", type=float, default=30.0)
+    parser.add_argument("--tenant-header", default="X-Tenant")
+    tenant = parser.add_mutually_exclusive_group()
+    tenant.add_argument("--tenant", help="отправлять все запросы в этот аккаунт гейтвея")
+    tenant.add_argument(
+        "--strip-tenant", action="store_true", help="убрать заголовок аккаунта из запросов"
+    )
+    args = parser.parse_args()
+
+    records = load(args.capture, args.limit)
+    if not records:
+        parser.error(f"{args.capture}: нет записей")
+    if args.tenant or args.strip_tenant:
+        rewrite_tenant(records, args.tenant_header, args.tenant, args.strip_tenant)
+
+    results, elapsed = asyncio.run(replay(records, args.target, args.speed, args.timeout))
+    print(report(results, elapsed))
+
+
+if __name__ == "__main__":
+    main()